@@ -1,5 +1,7 @@
 from __future__ import annotations
+import sys
 from enum import Enum
+from typing import Callable, ClassVar
 
 from generateHtml.context import ContextStack as ContextElement
 from generateHtml.utils import prepend_dash_before_uppercase, escape_html
@@ -10,8 +12,67 @@ _UNDERSCORED_ATTRIBUTES = frozenset(
 )
 _DASHED_ATTRIBUTES = frozenset(("data", "aria"))
 
+## Bit assigned to every tag class name and tag name used in `parent_tags`, for mask based validation
+_TAG_BITS: dict[str, int] = {}
+## One shared frozenset for every distinct `parent_tags` declaration
+_PARENT_TAGS_SETS: dict[frozenset[str], frozenset[str]] = {}
+## Attribute classes defined in this module by class name, used for kwargs lookup
+_ATTRIBUTE_CLASSES: dict[str, type[HtmlAttribute]] = {}
+
+
+def _specialized_display_prepare(prefix: str) -> Callable[[HtmlAttribute], str]:
+    """Creates `_display_prepare` with attribute's prefix bound as a constant."""
+
+    def _display_prepare(self: HtmlAttribute) -> str:
+        return prefix + self._value + '"'
+
+    return _display_prepare
+
 
 class HtmlAttribute(ContextElement):
+    __slots__ = ("_value", "_cached")
+
+    display_name: str = "html-attribute"
+    _prefix: str = 'html-attribute="'
+    # Names of tags the attribute can be used in, `None` for attributes allowed in every tag
+    parent_tags: ClassVar[frozenset[str] | None] = None
+    parent_tags_mask: int | None = None
+    # Set for classes using `_display_prepare` created by `_specialized_display_prepare`
+    _display_prepare_specialized: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.__module__ == __name__:
+            _ATTRIBUTE_CLASSES[cls.__name__] = cls
+        # Attribute name is derived once per class instead of on every render
+        if "display_name" not in cls.__dict__:
+            cls.display_name = (
+                prepend_dash_before_uppercase(cls.__name__)
+                .lower()
+                .replace("_", "-")
+                .strip("-")
+            )
+        cls.display_name = sys.intern(cls.display_name)
+        cls._prefix = f'{cls.display_name}="'
+        # Classes rendering plain `name="value"` get render function with their prefix baked in
+        specialized = "_display_prepare" not in cls.__dict__ and (
+            cls._display_prepare is HtmlAttribute._display_prepare
+            or cls._display_prepare_specialized
+        )
+        if specialized:
+            setattr(cls, "_display_prepare", _specialized_display_prepare(cls._prefix))
+        cls._display_prepare_specialized = specialized
+
+        declared_parent_tags = cls.__dict__.get("parent_tags")
+        if declared_parent_tags is not None:
+            parent_tags = frozenset(map(sys.intern, declared_parent_tags))
+            cls.parent_tags = _PARENT_TAGS_SETS.setdefault(parent_tags, parent_tags)
+        if cls.parent_tags is not None:
+            mask = 0
+            for tag in cls.parent_tags:
+                mask |= _TAG_BITS.setdefault(tag, 1 << len(_TAG_BITS))
+            cls.parent_tags_mask = mask
+
     def name_to_string(self: HtmlAttribute) -> str:
         """Converts class name into original attribute format.
 
@@ -25,29 +86,28 @@ class HtmlAttribute(ContextElement):
         str
             Original attribute format in string.
         """
-        return (
-            prepend_dash_before_uppercase(self.__class__.__name__)
-            .lower()
-            .replace("_", "-")
-            .strip("-")
-        )
+        return self.display_name
 
     @classmethod
     def check_attribute_value(cls, value) -> str:
-        if not (isinstance(value, (float, int, str))):
-            raise TypeError(
-                f"Wrong data type used for attribute {cls.__name__}: "
-                f"Got {type(value)} expected str."
-            )
-        return str(value)
+        value_type = type(value)
+        # Exact str is by far the most common value, so it is returned untouched
+        if value_type is str:
+            return value
+        if isinstance(value, (float, int, str)):
+            return str(value)
+        raise TypeError(
+            f"Wrong data type used for attribute {cls.__name__}: "
+            f"Got {value_type} expected str."
+        )
 
     def __init__(self, value: float | int | str) -> None:
         super().__init__()
+        self._cached: str | None = None
         self._value = escape_html(self.check_attribute_value(value))
 
     def _display_prepare(self) -> str:
-        class_name = getattr(self.__class__, "display_name", self.name_to_string())
-        return f'{class_name}="{self._value}"'
+        return self._prefix + self._value + '"'
 
     def display(self) -> str:
         """Main function for showing attribute in HTML syntax.
@@ -57,7 +117,10 @@ class HtmlAttribute(ContextElement):
         str
             Returns attribute as `str` in HTML format `attribute="value"`
         """
-        return self._display_prepare()
+        cached = self._cached
+        if cached is None:
+            cached = self._cached = self._display_prepare()
+        return cached
 
     def __str__(self) -> str:
         """Same as `display` method for showing attribute in HTML format.
@@ -83,10 +146,10 @@ class HtmlAttribute(ContextElement):
             Only `str`, `int` or `float` can be appended as `HtmlAttribute` value
         """
         for val in values:
-            if isinstance(val, (int, float, str)):
-                self.value += escape_html(str(val))
-            else:
+            if not isinstance(val, (int, float, str)):
                 raise ValueError("In attribute can only be added text.")
+        self._value += "".join([escape_html(str(val)) for val in values])
+        self._cached = None
         return self
 
     @property
@@ -98,7 +161,7 @@ class HtmlAttribute(ContextElement):
         str
             `HtmlAttribute` name in HTML format.
         """
-        return getattr(self.__class__, "display_name", self.__class__.__name__.lower())
+        return self.display_name
 
     @property
     def value(self) -> str:
@@ -116,6 +179,7 @@ class HtmlAttribute(ContextElement):
         if isinstance(value, (int, float)):
             value = str(value)
         self._value = value
+        self._cached = None
 
 
 class BooleanTrueDisplayOption(Enum):
@@ -124,64 +188,90 @@ class BooleanTrueDisplayOption(Enum):
     REPEATED = "repeated"
 
 
+_BOOLEAN_TRUE_DISPLAY_OPTIONS: dict[str, BooleanTrueDisplayOption] = {
+    option.value: option for option in BooleanTrueDisplayOption
+}
+
+
 class BooleanHtmlAttribute(HtmlAttribute):
     """Defines attribute with boolean value. Displays only attribute's key without value."""
 
+    __slots__ = ("_true_value_display", "_rendered")
+
     def __init__(
         self,
         value: float | int | str = "",
         true_value: str | BooleanTrueDisplayOption = "short",
     ):
         super().__init__(value)
-        self._value = escape_html(self.check_attribute_value(value))
         self.true_value_display = true_value
 
-    def _display_prepare(
-        self, true_value: None | str | BooleanTrueDisplayOption = None
-    ):
-        class_name = getattr(
-            self.__class__, "display_name", self.__class__.__name__.lower()
-        )
-        if true_value is None:
-            true_value = self.true_value_display
+    @property
+    def true_value_display(self) -> str | BooleanTrueDisplayOption:
+        return self._true_value_display
+
+    @true_value_display.setter
+    def true_value_display(self, true_value: str | BooleanTrueDisplayOption) -> None:
+        # Rendered output depends only on display option, so it is prepared up front
+        self._rendered = self._render_true_value(true_value)
+        self._true_value_display = true_value
+        self._cached = None
+
+    def _render_true_value(self, true_value: str | BooleanTrueDisplayOption) -> str:
+        class_name = self.display_name
         if isinstance(true_value, str):
-            try:
-                true_value = BooleanTrueDisplayOption[true_value.upper()]
-            except KeyError:
-                # Can be passed as custom value
-                pass
+            # Can be passed as custom value
+            true_value = _BOOLEAN_TRUE_DISPLAY_OPTIONS.get(true_value.lower(), true_value)
         if true_value == BooleanTrueDisplayOption.SHORT:
-            return f"{class_name}"
+            return class_name
         elif true_value == BooleanTrueDisplayOption.EMPTY:
-            return f'{class_name}=""'
+            return self._prefix + '"'
         elif true_value == BooleanTrueDisplayOption.REPEATED:
-            return f'{class_name}="{class_name}"'
+            return self._prefix + class_name + '"'
         elif isinstance(true_value, str):
-            return f'{class_name}="{true_value}"'
+            return self._prefix + true_value + '"'
         else:
             raise ValueError(f"Unsupported true_value: {true_value}")
-        return f"{class_name}"
+
+    def _display_prepare(
+        self, true_value: None | str | BooleanTrueDisplayOption = None
+    ):
+        if true_value is None:
+            return self._rendered
+        return self._render_true_value(true_value)
 
 
 class MultipleValueHtmlAttribute(HtmlAttribute):
     """Defines attribute with multiple value separated with selected separator."""
 
+    __slots__ = ()
+
     def __init__(self, value: str, *other_values, separator: str = " "):
         super().__init__(value)
 
-        for val in other_values:
-            self.value = "".join(
-                [self.value, separator, escape_html(self.check_attribute_value(val))]
+        if other_values:
+            values: list[str] = [self._value]
+            values.extend(
+                escape_html(self.check_attribute_value(val)) for val in other_values
             )
+            self._value = separator.join(values)
 
 
 class DashedHtmlAttribute(HtmlAttribute):
+    __slots__ = ("_after_dash_part", "_name", "_dashed_prefix")
+
     def __init__(self, after_dash_part: str, value: float | int | str):
         super().__init__(value)
         self._after_dash_part: str = after_dash_part
+        self._name: str = (
+            f"{self.display_name}-{after_dash_part}"
+            if after_dash_part
+            else self.display_name
+        )
+        self._dashed_prefix: str = f'{self._name}="'
 
     def _display_prepare(self) -> str:
-        return f'{self.name}="{self._value}"'
+        return self._dashed_prefix + self._value + '"'
 
     def name_to_string(self: DashedHtmlAttribute) -> str:
         """Converts class name into original attribute format.
@@ -196,27 +286,18 @@ class DashedHtmlAttribute(HtmlAttribute):
         str
             Original attribute format in string.
         """
-        class_name = (
-            prepend_dash_before_uppercase(self.__class__.__name__)
-            .lower()
-            .replace("_", "-")
-            .strip("-")
-        )
-        return f"{class_name}-{self._after_dash_part}"
+        return f"{self.display_name}-{self._after_dash_part}"
 
     @property
     def name(self) -> str:
-        class_name = getattr(
-            self.__class__, "display_name", self.__class__.__name__.lower()
-        )
-        return (
-            f"{class_name}{'-' if self._after_dash_part else ''}{self._after_dash_part}"
-        )
+        return self._name
 
 
 class Data_(DashedHtmlAttribute):
     """Specifies the URL of the resource to be used by the object"""
 
+    __slots__ = ()
+
     display_name: str = "data"
 
 
@@ -225,27 +306,30 @@ class Aria_(DashedHtmlAttribute):
     make web content and web applications (especially those developed with JavaScript) more accessible
     to people with disabilities."""
 
+    __slots__ = ()
+
     display_name: str = "aria"
 
 
 class Style_(HtmlAttribute):
     """Specifies an inline CSS style for an element"""
 
+    __slots__ = ()
+
     display_name: str = "style"
 
     def __init__(self, *styles: str, **kwgs_styles):
         super().__init__(value="")
-        sty: str = ""
-        for val in styles:
-            sty += val
-        for key, val in kwgs_styles.items():
-            sty += f"{key.replace('_', '-')}: {val};"
-        self.value += sty
+        sty: list[str] = list(styles)
+        sty.extend(f"{key.replace('_', '-')}: {val};" for key, val in kwgs_styles.items())
+        self.value = "".join(sty)
 
 
 class Accept(HtmlAttribute):
     """Specifies the types of files that the server accepts (only for type="file")"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
@@ -253,22 +337,30 @@ class AcceptCharset(HtmlAttribute):
     """Specifies the character encodings that are to be used for the form
     submission"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Accesskey(HtmlAttribute):
     """Specifies a shortcut key to activate/focus an element"""
 
+    __slots__ = ()
+
 
 class Action(HtmlAttribute):
     """Specifies where to send the form-data when a form is submitted"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Alt(HtmlAttribute):
     """Specifies an alternate text when the original element fails to display"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Area", "Img", "Input"))
 
 
@@ -276,6 +368,8 @@ class Async(BooleanHtmlAttribute):
     """Specifies that the script is executed asynchronously (only for external
     scripts)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Script",))
 
 
@@ -283,6 +377,8 @@ class Autocomplete(HtmlAttribute):
     """Specifies whether the <form> or the <input> element should have autocomplete
     enabled"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form", "Input"))
 
 
@@ -290,18 +386,24 @@ class Autofocus(BooleanHtmlAttribute):
     """Specifies that the element should automatically get focus when the page
     loads"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Button", "Input", "Select", "Textarea"))
 
 
 class Autoplay(BooleanHtmlAttribute):
     """Specifies that the audio/video will start playing as soon as it is ready"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Charset(HtmlAttribute):
     """Specifies the character encoding"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meta", "Script"))
 
 
@@ -309,12 +411,16 @@ class Checked(BooleanHtmlAttribute):
     """Specifies that an <input> element should be pre-selected when the page loads
     (for type="checkbox" or type="radio")"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
 class Cite_(HtmlAttribute):
     """Specifies a URL which explains the quote/deleted/inserted text"""
 
+    __slots__ = ()
+
     display_name: str = "cite"
     parent_tags = frozenset(("Del", "Ins"))
 
@@ -323,45 +429,61 @@ class Class(MultipleValueHtmlAttribute):
     """Specifies one or more class names for an element (refers to a class in a
     style sheet)"""
 
+    __slots__ = ()
+
 
 class Cols(HtmlAttribute):
     """Specifies the visible width of a text area"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Textarea",))
 
 
 class Colspan(HtmlAttribute):
     """Specifies the number of columns a table cell should span"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Td", "Th"))
 
 
 class Content(HtmlAttribute):
     """Gives the value associated with the http-equiv or name attribute"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meta",))
 
 
 class Contenteditable(HtmlAttribute):
     """Specifies whether the content of an element is editable or not"""
 
+    __slots__ = ()
+
 
 class Controls(BooleanHtmlAttribute):
     """Specifies that audio/video controls should be displayed (such as a
     play/pause button etc.)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Coords(HtmlAttribute):
     """Specifies the coordinates of the area"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Area",))
 
 
 class Datetime(HtmlAttribute):
     """Specifies the date and time"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Del", "Ins", "Time"))
 
 
@@ -369,6 +491,8 @@ class Default(BooleanHtmlAttribute):
     """Specifies that the track is to be enabled if the user's preferences do not
     indicate that another track would be more appropriate"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Track",))
 
 
@@ -376,24 +500,32 @@ class Defer(BooleanHtmlAttribute):
     """Specifies that the script is executed when the page has finished parsing
     (only for external scripts)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Script",))
 
 
 class Dir_(HtmlAttribute):
     """Specifies the text direction for the content in an element"""
 
+    __slots__ = ()
+
     display_name: str = "dir"
 
 
 class Dirname(HtmlAttribute):
     """Specifies that the text direction will be submitted"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Textarea"))
 
 
 class Disabled(BooleanHtmlAttribute):
     """Specifies that the specified element/group of elements should be disabled"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         ("Button", "Fieldset", "Input", "Option", "Select", "Textarea")
     )
@@ -403,33 +535,45 @@ class Download(HtmlAttribute):
     """Specifies that the target will be downloaded when a user clicks on the
     hyperlink"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area"))
 
 
 class Draggable(HtmlAttribute):
     """Specifies whether an element is draggable or not"""
 
+    __slots__ = ()
+
 
 class Enctype(HtmlAttribute):
     """Specifies how the form-data should be encoded when submitting it to the
     server (only for method="post")"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Enterkeyhint(HtmlAttribute):
     """Specifies the text of the enter-key on a virtual keyboard"""
 
+    __slots__ = ()
+
 
 class For(HtmlAttribute):
     """Specifies which form element(s) a label/calculation is bound to"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Output",))
 
 
 class Form_(HtmlAttribute):
     """Specifies the name of the form the element belongs to"""
 
+    __slots__ = ()
+
     display_name: str = "form"
     parent_tags = frozenset(
         (
@@ -449,76 +593,104 @@ class Formaction(HtmlAttribute):
     """Specifies where to send the form-data when a form is submitted. Only for
     type="submit" """
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Button", "Input"))
 
 
 class Headers(HtmlAttribute):
     """Specifies one or more headers cells a cell is related to"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Td", "Th"))
 
 
 class Height(HtmlAttribute):
     """Specifies the height of the element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Embed", "Iframe", "Img", "Input", "Object", "Video"))
 
 
 class Hidden(HtmlAttribute):
     """Specifies that an element is not yet, or is no longer, relevant"""
 
+    __slots__ = ()
+
 
 class High(HtmlAttribute):
     """Specifies the range that is considered to be a high value"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meter",))
 
 
 class Href(HtmlAttribute):
     """Specifies the URL of the page the link goes to"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area", "Base", "Link"))
 
 
 class Hreflang(HtmlAttribute):
     """Specifies the language of the linked document"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area", "Link"))
 
 
 class HttpEquiv(HtmlAttribute):
     """Provides an HTTP header for the information/value of the content attribute"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meta",))
 
 
 class Id(HtmlAttribute):
     """Specifies a unique id for an element"""
 
+    __slots__ = ()
+
 
 class Inert(BooleanHtmlAttribute):
     """Specifies that the browser should ignore this section"""
 
+    __slots__ = ()
+
 
 class Inputmode(HtmlAttribute):
     """Specifies the mode of a virtual keyboard"""
 
+    __slots__ = ()
+
 
 class Ismap(BooleanHtmlAttribute):
     """Specifies an image as a server-side image map"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Img",))
 
 
 class Kind(HtmlAttribute):
     """Specifies the kind of text track"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Track",))
 
 
 class Label_(HtmlAttribute):
     """Specifies the title of the text track"""
 
+    __slots__ = ()
+
     display_name: str = "label"
     parent_tags = frozenset(("Track", "Option", "Optgroup"))
 
@@ -526,11 +698,15 @@ class Label_(HtmlAttribute):
 class Lang(HtmlAttribute):
     """Specifies the language of the element's content"""
 
+    __slots__ = ()
+
 
 class List(HtmlAttribute):
     """Refers to a <datalist> element that contains pre-defined options for an <input>
     element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
@@ -538,60 +714,80 @@ class Loop(BooleanHtmlAttribute):
     """Specifies that the audio/video will start over again, every time it is
     finished"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Low(HtmlAttribute):
     """Specifies the range that is considered to be a low value"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meter",))
 
 
 class Max(HtmlAttribute):
     """Specifies the maximum value"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Meter", "Progress"))
 
 
 class Maxlength(HtmlAttribute):
     """Specifies the maximum number of characters allowed in an element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Textarea"))
 
 
 class Media(HtmlAttribute):
     """Specifies what media/device the linked document is optimized for"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area", "Link", "Source", "Style"))
 
 
 class Method(HtmlAttribute):
     """Specifies the HTTP method to use when sending form-data"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Min(HtmlAttribute):
     """Specifies a minimum value"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Meter"))
 
 
 class Multiple(BooleanHtmlAttribute):
     """Specifies that a user can enter more than one value"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Select"))
 
 
 class Muted(BooleanHtmlAttribute):
     """Specifies that the audio output of the video should be muted"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Video", "Audio"))
 
 
 class Name(HtmlAttribute):
     """Specifies the name of the element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         (
             "Button",
@@ -613,41 +809,55 @@ class Name(HtmlAttribute):
 class Novalidate(BooleanHtmlAttribute):
     """Specifies that the form should not be validated when submitted"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Onabort(HtmlAttribute):
     """Script to be run on abort"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Embed", "Img", "Object", "Video"))
 
 
 class Onafterprint(HtmlAttribute):
     """Script to be run after the document is printed"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onbeforeprint(HtmlAttribute):
     """Script to be run before the document is printed"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onbeforeunload(HtmlAttribute):
     """Script to be run when the document is about to be unloaded"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onblur(HtmlAttribute):
     """Script to be run when the element loses focus"""
 
+    __slots__ = ()
+
 
 class Oncanplay(HtmlAttribute):
     """Script to be run when a file is ready to start playing (when it has buffered
     enough to begin)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Embed", "Object", "Video"))
 
 
@@ -655,70 +865,102 @@ class Oncanplaythrough(HtmlAttribute):
     """Script to be run when a file can be played all the way to the end without
     pausing for buffering"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onchange(HtmlAttribute):
     """Script to be run when the value of the element is changed"""
 
+    __slots__ = ()
+
 
 class Onclick(HtmlAttribute):
     """Script to be run when the element is being clicked"""
 
+    __slots__ = ()
+
 
 class Oncontextmenu(HtmlAttribute):
     """Script to be run when a context menu is triggered"""
 
+    __slots__ = ()
+
 
 class Oncopy(HtmlAttribute):
     """Script to be run when the content of the element is being copied"""
 
+    __slots__ = ()
+
 
 class Oncuechange(HtmlAttribute):
     """Script to be run when the cue changes in a"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Track",))
 
 
 class Oncut(HtmlAttribute):
     """Script to be run when the content of the element is being cut"""
 
+    __slots__ = ()
+
 
 class Ondblclick(HtmlAttribute):
     """Script to be run when the element is being double-clicked"""
 
+    __slots__ = ()
+
 
 class Ondrag(HtmlAttribute):
     """Script to be run when the element is being dragged"""
 
+    __slots__ = ()
+
 
 class Ondragend(HtmlAttribute):
     """Script to be run at the end of a drag operation"""
 
+    __slots__ = ()
+
 
 class Ondragenter(HtmlAttribute):
     """Script to be run when an element has been dragged to a valid drop target"""
 
+    __slots__ = ()
+
 
 class Ondragleave(HtmlAttribute):
     """Script to be run when an element leaves a valid drop target"""
 
+    __slots__ = ()
+
 
 class Ondragover(HtmlAttribute):
     """Script to be run when an element is being dragged over a valid drop target"""
 
+    __slots__ = ()
+
 
 class Ondragstart(HtmlAttribute):
     """Script to be run at the start of a drag operation"""
 
+    __slots__ = ()
+
 
 class Ondrop(HtmlAttribute):
     """Script to be run when dragged element is being dropped"""
 
+    __slots__ = ()
+
 
 class Ondurationchange(HtmlAttribute):
     """Script to be run when the length of the media changes"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -726,6 +968,8 @@ class Onemptied(HtmlAttribute):
     """Script to be run when something bad happens and the file is suddenly
     unavailable (like unexpectedly disconnects)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -733,12 +977,16 @@ class Onended(HtmlAttribute):
     """Script to be run when the media has reach the end (a useful event for
     messages like "thanks for listening")"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onerror(HtmlAttribute):
     """Script to be run when an error occurs"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         ("Audio", "Body", "Embed", "Img", "Object", "Script", "Style", "Video")
     )
@@ -747,36 +995,52 @@ class Onerror(HtmlAttribute):
 class Onfocus(HtmlAttribute):
     """Script to be run when the element gets focus"""
 
+    __slots__ = ()
+
 
 class Onhashchange(HtmlAttribute):
     """Script to be run when there has been changes to the anchor part of the a URL"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Oninput(HtmlAttribute):
     """Script to be run when the element gets user input"""
 
+    __slots__ = ()
+
 
 class Oninvalid(HtmlAttribute):
     """Script to be run when the element is invalid"""
 
+    __slots__ = ()
+
 
 class Onkeydown(HtmlAttribute):
     """Script to be run when a user is pressing a key"""
 
+    __slots__ = ()
+
 
 class Onkeypress(HtmlAttribute):
     """Script to be run when a user presses a key"""
 
+    __slots__ = ()
+
 
 class Onkeyup(HtmlAttribute):
     """Script to be run when a user releases a key"""
 
+    __slots__ = ()
+
 
 class Onload(HtmlAttribute):
     """Script to be run when the element is finished loading"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         ("Body", "Iframe", "Img", "Input", "Link", "Script", "Style")
     )
@@ -785,12 +1049,16 @@ class Onload(HtmlAttribute):
 class Onloadeddata(HtmlAttribute):
     """Script to be run when media data is loaded"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onloadedmetadata(HtmlAttribute):
     """Script to be run when meta data (like dimensions and duration) are loaded"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -798,71 +1066,99 @@ class Onloadstart(HtmlAttribute):
     """Script to be run just as the file begins to load before anything is actually
     loaded"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onmousedown(HtmlAttribute):
     """Script to be run when a mouse button is pressed down on an element"""
 
+    __slots__ = ()
+
 
 class Onmousemove(HtmlAttribute):
     """Script to be run as long as the  mouse pointer is moving over an element"""
 
+    __slots__ = ()
+
 
 class Onmouseout(HtmlAttribute):
     """Script to be run when a mouse pointer moves out of an element"""
 
+    __slots__ = ()
+
 
 class Onmouseover(HtmlAttribute):
     """Script to be run when a mouse pointer moves over an element"""
 
+    __slots__ = ()
+
 
 class Onmouseup(HtmlAttribute):
     """Script to be run when a mouse button is released over an element"""
 
+    __slots__ = ()
+
 
 class Onmousewheel(HtmlAttribute):
     """Script to be run when a mouse wheel is being scrolled over an element"""
 
+    __slots__ = ()
+
 
 class Onoffline(HtmlAttribute):
     """Script to be run when the browser starts to work offline"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Ononline(HtmlAttribute):
     """Script to be run when the browser starts to work online"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onpageshow(HtmlAttribute):
     """Script to be run when a user navigates to a page"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onpaste(HtmlAttribute):
     """Script to be run when the user pastes some content in an element"""
 
+    __slots__ = ()
+
 
 class Onpause(HtmlAttribute):
     """Script to be run when the media is paused either by the user or
     programmatically"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onplay(HtmlAttribute):
     """Script to be run when the media has started playing"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onplaying(HtmlAttribute):
     """Script to be run when the media has started playing"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -870,6 +1166,8 @@ class Onprogress(HtmlAttribute):
     """Script to be run when the browser is in the process of getting the media
     data"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -877,29 +1175,39 @@ class Onratechange(HtmlAttribute):
     """Script to be run each time the playback rate changes (like when a user
     switches to a slow motion or fast forward mode)."""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onreset(HtmlAttribute):
     """Script to be run when a reset button in a form is clicked."""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
 class Onresize(HtmlAttribute):
     """Script to be run when the browser window is being resized."""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onscroll(HtmlAttribute):
     """Script to be run when an element's scrollbar is being scrolled"""
 
+    __slots__ = ()
+
 
 class Onsearch(HtmlAttribute):
     """Script to be run when the user writes something in a search field (for
     <input type="search">)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
@@ -907,6 +1215,8 @@ class Onseeked(HtmlAttribute):
     """Script to be run when the seeking attribute is set to false indicating that
     seeking has ended"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -914,23 +1224,31 @@ class Onseeking(HtmlAttribute):
     """Script to be run when the seeking attribute is set to true indicating that
     seeking is active"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onselect(HtmlAttribute):
     """Script to be run when the element gets selected"""
 
+    __slots__ = ()
+
 
 class Onstalled(HtmlAttribute):
     """Script to be run when the browser is unable to fetch the media data for
     whatever reason"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onsubmit(HtmlAttribute):
     """Script to be run when a form is submitted"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Form",))
 
 
@@ -938,6 +1256,8 @@ class Onsuspend(HtmlAttribute):
     """Script to be run when fetching the media data is stopped before it is
     completely loaded for whatever reason"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -945,12 +1265,16 @@ class Ontimeupdate(HtmlAttribute):
     """Script to be run when the playing position has changed (like when the user
     fast forwards to a different point in the media)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Ontoggle(HtmlAttribute):
     """Script to be run when the user opens or closes the <details> element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Details",))
 
 
@@ -958,12 +1282,16 @@ class Onunload(HtmlAttribute):
     """Script to be run when a page has unloaded (or the browser window has been
     closed)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Body",))
 
 
 class Onvolumechange(HtmlAttribute):
     """Script to be run each time the volume of a video/audio has been changed"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
@@ -971,22 +1299,30 @@ class Onwaiting(HtmlAttribute):
     """Script to be run when the media has paused but is expected to resume (like
     when the media pauses to buffer more data)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Onwheel(HtmlAttribute):
     """Script to be run when the mouse wheel rolls up or down over an element"""
 
+    __slots__ = ()
+
 
 class Open(BooleanHtmlAttribute):
     """Specifies that the details should be visible (open) to the user"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Details",))
 
 
 class Optimum(HtmlAttribute):
     """Specifies what value is the optimal value for the gauge"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Meter",))
 
 
@@ -994,28 +1330,38 @@ class Pattern(HtmlAttribute):
     """Specifies a regular expression that an <input> element's value is checked
     against"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
 class Placeholder(HtmlAttribute):
     """Specifies a short hint that describes the expected value of the element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Textarea"))
 
 
 class Popover(HtmlAttribute):
     """Specifies a popover element"""
 
+    __slots__ = ()
+
 
 class Popovertarget(HtmlAttribute):
     """Specifies which popover element to invoked"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Button", "Input"))
 
 
 class Popovertargetaction(HtmlAttribute):
     """Specifies what happens to the popover element when the button is clicked"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Button", "Input"))
 
 
@@ -1023,6 +1369,8 @@ class Poster(HtmlAttribute):
     """Specifies an image to be shown while the video is downloading, or until the
     user hits the play button"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Video",))
 
 
@@ -1030,12 +1378,16 @@ class Preload(HtmlAttribute):
     """Specifies if and how the author thinks the audio/video should be loaded when
     the page loads"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Audio", "Video"))
 
 
 class Readonly(BooleanHtmlAttribute):
     """Specifies that the element is read-only"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Textarea"))
 
 
@@ -1043,36 +1395,48 @@ class Rel(HtmlAttribute):
     """Specifies the relationship between the current document and the linked
     document"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area", "Form", "Link"))
 
 
 class Required(BooleanHtmlAttribute):
     """Specifies that the element must be filled out before submitting the form"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Select", "Textarea"))
 
 
 class Reversed(BooleanHtmlAttribute):
     """Specifies that the list order should be descending (9,8,7...)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Ol",))
 
 
 class Rows(HtmlAttribute):
     """Specifies the visible number of lines in a text area"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Textarea",))
 
 
 class Rowspan(HtmlAttribute):
     """Specifies the number of rows a table cell should span"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Td", "Th"))
 
 
 class Sandbox(HtmlAttribute):
     """Enables an extra set of restrictions for the content in an <iframe>"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Iframe",))
 
 
@@ -1080,18 +1444,24 @@ class Scope(HtmlAttribute):
     """Specifies whether a header cell is a header for a column, row, or group of
     columns or rows"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Th",))
 
 
 class Selected(BooleanHtmlAttribute):
     """Specifies that an option should be pre-selected when the page loads"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Option",))
 
 
 class Shape(HtmlAttribute):
     """Specifies the shape of the area"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Area",))
 
 
@@ -1099,18 +1469,24 @@ class Size(HtmlAttribute):
     """Specifies the width, in characters (for <input>) or specifies the number of
     visible options (for <select>)"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input", "Select"))
 
 
 class Sizes(HtmlAttribute):
     """Specifies the size of the linked resource"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Img", "Link", "Source"))
 
 
 class Span_(HtmlAttribute):
     """Specifies the number of columns to span"""
 
+    __slots__ = ()
+
     display_name: str = "span"
     parent_tags = frozenset(("Col", "Colgroup"))
 
@@ -1119,10 +1495,14 @@ class Spellcheck(HtmlAttribute):
     """Specifies whether the element is to have its spelling and grammar checked or
     not"""
 
+    __slots__ = ()
+
 
 class Src(HtmlAttribute):
     """Specifies the URL of the media file"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         (
             "Audio",
@@ -1141,57 +1521,77 @@ class Src(HtmlAttribute):
 class Srcdoc(HtmlAttribute):
     """Specifies the HTML content of the page to show in the <iframe>"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Iframe",))
 
 
 class Srclang(HtmlAttribute):
     """Specifies the language of the track text data (required if kind="subtitles")"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Track",))
 
 
 class Srcset(HtmlAttribute):
     """Specifies the URL of the image to use in different situations"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Img", "Source"))
 
 
 class Start(HtmlAttribute):
     """Specifies the start value of an ordered list"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Ol",))
 
 
 class Step(HtmlAttribute):
     """Specifies the legal number intervals for an input field"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Input",))
 
 
 class Tabindex(HtmlAttribute):
     """Specifies the tabbing order of an element"""
 
+    __slots__ = ()
+
 
 class Target(HtmlAttribute):
     """Specifies the target for where to open the linked document or where to
     submit the form"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("A", "Area", "Base", "Form"))
 
 
 class Title_(HtmlAttribute):
     """Specifies extra information about an element"""
 
+    __slots__ = ()
+
     display_name: str = "title"
 
 
 class Translate(HtmlAttribute):
     """Specifies whether the content of an element should be translated or not"""
 
+    __slots__ = ()
+
 
 class Type(HtmlAttribute):
     """Specifies the type of element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         (
             "A",
@@ -1211,12 +1611,16 @@ class Type(HtmlAttribute):
 class Usemap(HtmlAttribute):
     """Specifies an image as a client-side image map"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Img", "Object"))
 
 
 class Value(HtmlAttribute):
     """Specifies the value of the element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(
         ("Button", "Input", "Li", "Option", "Meter", "Progress", "Param")
     )
@@ -1225,6 +1629,8 @@ class Value(HtmlAttribute):
 class Width(HtmlAttribute):
     """Specifies the width of the element"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Embed", "Iframe", "Img", "Input", "Object", "Video"))
 
 
@@ -1232,4 +1638,6 @@ class Wrap(HtmlAttribute):
     """Specifies how the text in a text area is to be wrapped when submitted in a
     form"""
 
+    __slots__ = ()
+
     parent_tags = frozenset(("Textarea",))
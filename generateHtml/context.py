@@ -1,48 +1,73 @@
 from __future__ import annotations
-from contextvars import ContextVar
-from abc import abstractmethod, ABC
+from collections.abc import Iterable
+from contextvars import ContextVar, Token
 
 
-class ContextStack(ABC):
-    _context_var: ContextVar[list[list[ContextStack]] | None] = ContextVar(
+class ContextStack:
+    __slots__ = ("_context_token",)
+
+    # Token of the innermost `with` block of this element paired with the one it replaced
+    _context_token: tuple[Token, tuple | None] | None
+
+    # Frame of the innermost `with` block, mapping id() of an element to the element,
+    # so removal is O(1) and keeps order. Outer frames are restored through tokens.
+    _context_var: ContextVar[dict[int, ContextStack] | None] = ContextVar(
         "storage", default=None
     )
 
     def __init__(self):
-        self._add_to_context(self)
-
-    @property
-    def _context_elements(self) -> list[list[ContextStack]] | None:
-        context_elements = self._context_var.get()
-        if context_elements is None:
-            context_elements = []
-            self._context_var.set(context_elements)
-        return context_elements
+        # Same as `_add_to_context(self)`, inlined since it runs for every created node
+        frame = ContextStack._context_var.get()
+        if frame is not None:
+            frame[id(self)] = self
 
     # Context manipulation methods
     def _add_to_context(self, element: ContextStack) -> None:
-        if self._context_elements:
-            self._context_elements[-1].append(element)
+        frame = ContextStack._context_var.get()
+        if frame is not None:
+            frame[id(element)] = element
 
     def _remove_from_context(self, element: ContextStack) -> None:
-        if self._context_elements and element in self._context_elements[-1]:
-            self._context_elements[-1].remove(element)
-        self._clear_context_elements()
+        frame = ContextStack._context_var.get()
+        if frame is not None:
+            frame.pop(id(element), None)
 
-    def _clear_context_elements(self) -> None:
-        if not self._context_elements:
-            self._context_var.set(None)
+    def _remove_all_from_context(self, elements: Iterable[ContextStack]) -> None:
+        frame = ContextStack._context_var.get()
+        if frame:
+            for element in elements:
+                frame.pop(id(element), None)
 
     # Context manager methods
     def __enter__(self):
-        self._context_elements.append([])
+        # Token is kept together with the one of enclosing `with` block of the same element,
+        # so re-entering element inside its own block restores the outer token on exit
+        self._context_token = (
+            ContextStack._context_var.set({}),
+            getattr(self, "_context_token", None),
+        )
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        for child in self._context_elements.pop():
-            self.add(child)
-        self._clear_context_elements()
+        children = ContextStack._context_var.get()
+        token, self._context_token = self._context_token
+        ContextStack._context_var.reset(token)
+        if children:
+            self.add(*children.values())
+
+    # Copying methods
+    def __getstate__(self) -> tuple[dict | None, dict[str, object]]:
+        # Token belongs to the running `with` block and cannot be copied, so copies never keep it
+        slots = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if name != "_context_token" and hasattr(self, name)
+        }
+        return getattr(self, "__dict__", None), slots
 
-    @abstractmethod
     def add(self, *args):
         """Method for adding arguments into context stack"""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} has to implement method 'add'."
+        )
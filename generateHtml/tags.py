@@ -1,7 +1,8 @@
 from __future__ import annotations
+import sys
 from enum import Enum
-from copy import deepcopy
-from typing import Iterator
+from functools import lru_cache
+from typing import Iterator, cast
 
 from generateHtml.context import ContextStack as ContextElement
 from generateHtml.attributes import (
@@ -9,6 +10,8 @@ from generateHtml.attributes import (
     DashedHtmlAttribute,
     _UNDERSCORED_ATTRIBUTES,
     _DASHED_ATTRIBUTES,
+    _TAG_BITS,
+    _ATTRIBUTE_CLASSES,
 )
 from generateHtml.exceptions import (
     DuplicateAttributeError,
@@ -16,12 +19,93 @@ from generateHtml.exceptions import (
     IllegalCompositionError,
 )
 
-from generateHtml.utils import get_class_from_string, escape_html
+from generateHtml.utils import escape_html
+
+
+class _Indentation(dict[int, str]):
+    """Indentation strings for each depth level, created once per rendering on first use."""
+
+    def __init__(self, indent: str):
+        super().__init__()
+        self.indent = indent
+
+    def __missing__(self, depth_level: int) -> str:
+        indentation = self[depth_level] = depth_level * self.indent
+        return indentation
+
+
+@lru_cache(maxsize=2048)
+def _normalize_attribute_key(key: str) -> str:
+    """Converts kwargs attribute name into dict value (as original HTML).
+
+    Result is interned, so it is the same object as attribute's interned `display_name`."""
+    return sys.intern(key.lower().strip("_").replace("_", "-"))
+
+
+@lru_cache(maxsize=2048)
+def _normalize_item_key(key: str) -> str:
+    """Converts attribute name used in dictionary notation into dict value (as original HTML)."""
+    return sys.intern(key.lower().strip("-").replace("_", "-"))
+
+
+@lru_cache(maxsize=2048)
+def _resolve_attribute(key: str) -> tuple[str, str | None, type[HtmlAttribute]]:
+    """Resolves kwargs attribute name into HTML attribute name, part after dash
+    (`None` for non dashed attributes) and `HtmlAttribute` class."""
+    attribute_key: str = _normalize_attribute_key(key)
+
+    # Convert kwargs attribute name into class name
+    splitted: list[str] = attribute_key.split("-", 1)
+    is_dashed: bool = splitted[0] in _DASHED_ATTRIBUTES
+    after_dash_part: str = splitted[1] if len(splitted) > 1 and is_dashed else ""
+
+    predashed_part: str | None = (
+        "".join([a.capitalize() for a in splitted])
+        if not is_dashed
+        else splitted[0].capitalize()
+    )
+
+    underscoring_collision = "_" if splitted[0] in _UNDERSCORED_ATTRIBUTES else ""
+
+    attribute_class = f"{predashed_part}{underscoring_collision}"
+    # Use key to find HtmlAttribute class
+    attribute_class_ = _ATTRIBUTE_CLASSES.get(attribute_class)
+    if attribute_class_ is None:
+        raise AttributeError(
+            f"module 'generateHtml.attributes' has no attribute '{attribute_class}'"
+        )
+    return (
+        attribute_key,
+        after_dash_part if issubclass(attribute_class_, DashedHtmlAttribute) else None,
+        attribute_class_,
+    )
 
 
 class HtmlElement(ContextElement):
     """Base class containing properties used in all html element tags."""
 
+    __slots__ = ("_child_nodes", "_attributes")
+
+    _tag_name: str = "htmlelement"
+    _is_self_closing: bool = False
+    _open_tag: str = "<htmlelement"
+    _start_tag: str = "<htmlelement>"
+    _close_tag: str | None = "</htmlelement>"
+    _tag_bit: int = 0
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Tag name and its open/close tag parts are resolved once per class instead of on every render
+        cls._tag_name = sys.intern(getattr(cls, "display_name", cls.__name__.lower()))
+        cls._open_tag = sys.intern(f"<{cls._tag_name}")
+        # Whole start tag for elements without attributes
+        cls._start_tag = sys.intern(f"<{cls._tag_name}>")
+        cls._close_tag = (
+            None if cls._is_self_closing else sys.intern(f"</{cls._tag_name}>")
+        )
+        # Same bit as used in attributes' `parent_tags_mask`, shared through `_TAG_BITS`
+        cls._tag_bit = _TAG_BITS.setdefault(cls.__name__, 1 << len(_TAG_BITS))
+
     def __init__(
         self,
         *inner_content: HtmlElement | HtmlAttribute | Text | str | int | float,
@@ -29,138 +113,138 @@ class HtmlElement(ContextElement):
     ):
         super().__init__()
         self._child_nodes: list[HtmlElement | Text] = []
-        self._attributes: dict[str, HtmlAttribute] = {}
+        # Most elements have no attributes, dict is created on first access of `attributes`
+        self._attributes: dict[str, HtmlAttribute] | None = None
 
-        self._parse_attributes(attributes)
-        self._parse_inner_content(inner_content)
-
-        self._validate_attributes()
+        # Empty shells (filled later by `add`) need no parsing
+        if attributes:
+            self._parse_attributes(attributes)
+        if inner_content:
+            self._parse_inner_content(inner_content)
 
     def _parse_attributes(self, attributes: dict[str, HtmlAttribute | str | int | float]) -> None:
+        element_attributes = self.attributes
         for key, val in attributes.items():
-            # Convert kwargs attribute name into dict value (as original HTML)
-            attribute_key: str = key.lower().strip("_").replace("_", "-")
             if isinstance(val, HtmlAttribute):
-                self.attributes[attribute_key] = val
+                attribute_key: str = _normalize_attribute_key(key)
+                attribute: HtmlAttribute = val
             elif isinstance(val, (str, int, float)):
                 if not isinstance(val, str):
                     val = str(val)
 
-                # Convert kwargs attribute name into class name
-                splitted: list[str] = attribute_key.split("-", 1)
-                after_dash_part: str = (
-                    splitted[1]
-                    if len(splitted) > 1 and splitted[0] in _DASHED_ATTRIBUTES
-                    else ""
-                )
-
-                predashed_part: str | None = (
-                    "".join((a.capitalize() for a in splitted))
-                    if splitted[0] not in _DASHED_ATTRIBUTES
-                    else splitted[0].capitalize()
-                )
-
-                underscoring_collision = (
-                    "_"
-                    if attribute_key.partition("-")[0] in _UNDERSCORED_ATTRIBUTES
-                    else ""
-                )
-
-                attribute_class = f"{predashed_part}{underscoring_collision}"
-                # Use key to find HtmlAttribute class and then initialize it with val as argument
-                attribute_class_ = get_class_from_string(
-                    "generateHtml.attributes", attribute_class
-                )
-                self.attributes[attribute_key] = (
-                    attribute_class_(after_dash_part, val)
-                    if issubclass(attribute_class_, DashedHtmlAttribute)
+                attribute_key, after_dash_part, attribute_class_ = _resolve_attribute(key)
+                attribute = (
+                    cast(type[DashedHtmlAttribute], attribute_class_)(after_dash_part, val)
+                    if after_dash_part is not None
                     else attribute_class_(val)
                 )
             else:
                 raise ValueError(
                     f"Value {val} for the key {key} has to be str or HtmlAttribute. Got '{type(val)}'"
                 )
+            element_attributes[attribute_key] = attribute
+            self._validate_attribute(attribute)
 
     def _parse_inner_content(self, inner_content, index: int | None = None) -> None:
         """Method to extract HTML child nodes and HTML node attributes from iterable item."""
         if index is not None and isinstance(index, int) and len(self) < index:
             raise IndexError("Out of range while inserting into child list.")
 
+        child_nodes = self.child_nodes
+        new_nodes: list[HtmlElement | HtmlAttribute | Text] = []
+        node: HtmlElement | Text
         for attr in inner_content:
-            if self is attr:  # Preventing circular dependency
-                attr = deepcopy(attr)
-            if issubclass(type(attr), HtmlAttribute):
-                if self.attributes.get(attr.name_to_string()):
+            if isinstance(attr, HtmlElement):
+                # Preventing circular dependency
+                if attr is self:
+                    raise IllegalCompositionError("Cannot add element to itself")
+                node = attr
+            elif isinstance(attr, _TEXT_TYPES):
+                if isinstance(attr, Text):
+                    node = attr
+                else:
+                    node = Text._from_str(attr if isinstance(attr, str) else str(attr))
+            elif isinstance(attr, HtmlAttribute):
+                attribute_key = attr.name_to_string()
+                if self.attributes.get(attribute_key):
                     raise DuplicateAttributeError(
-                        f"Attribute {attr.name_to_string()} is already defined in tag {self}"
+                        f"Attribute {attribute_key} is already defined in tag {self}"
                     )
-                self.attributes[attr.name_to_string()] = attr
-                self._validate_attributes()
-                self._remove_from_context(attr)
-            elif issubclass(type(attr), HtmlElement):
-                if index is not None:
-                    self.child_nodes[index] = attr
-                    index += 1
-                else:
-                    self.child_nodes.append(attr)
-            elif isinstance(attr, (Text, str, int, float)):
-                text_node = Text(str(attr)) if not isinstance(attr, Text) else attr
-                if index is not None:
-                    self.child_nodes[index] = text_node
-                    index += 1
-                else:
-                    self.child_nodes.append(text_node)
+                self.attributes[attribute_key] = attr
+                self._validate_attribute(attr)
+                new_nodes.append(attr)
+                continue
             elif isinstance(attr, (list, tuple)):
                 # recursive parsing of elements in iterables
-                if index is not None:
-                    self.child_nodes[index] = Container(*attr)
-                    index += 1
-                else:
-                    self.child_nodes.append(Container(*attr))
+                node = Container(*attr)
             else:
                 raise TypeError(
                     f"Argument {attr} is not subclass of {HtmlAttribute}, "
                     f"nor subclass of {HtmlElement} nor str"
                 )
+            if index is not None:
+                child_nodes[index] = node
+                index += 1
+            else:
+                child_nodes.append(node)
+            new_nodes.append(node)
 
-        # Removing nodes which have parent from context
-        if issubclass(type(self), ContextElement):
-            for child in self.child_nodes:
-                self._remove_from_context(child)
+        # Removing nodes which have parent from context, earlier child nodes were removed when added
+        self._remove_all_from_context(new_nodes)
 
     def _validate_attributes(self):
+        for attr in self.attributes.values():
+            self._validate_attribute(attr)
+
+    def _validate_attribute(self, attr: HtmlAttribute) -> None:
+        """Validates single attribute, so adding attribute does not re-check all existing ones."""
         # TODO: Check for attribute combination in tag
 
         # Check assignment attributes to parent html tags
-        for attr in self.attributes.values():
-            parent_tags = getattr(attr, "parent_tags", None)
-            if parent_tags is not None and self.__class__.__name__ not in parent_tags:
-                raise WrongAttributeElementCombinationError(
-                    f"Attribute '{attr.__class__.__name__}' "
-                    f"cannot be used in tag '{self.__class__.__name__}'. Try one of these tags instead: {', '.join(parent_tags)}"
-                )
+        parent_tags_mask = attr.parent_tags_mask
+        if (
+            parent_tags_mask is not None
+            and not self._tag_bit & parent_tags_mask
+        ):
+            raise WrongAttributeElementCombinationError(
+                f"Attribute '{attr.__class__.__name__}' "
+                f"cannot be used in tag '{self.__class__.__name__}'. Try one of these tags instead: {', '.join(attr.parent_tags or ())}"
+            )
 
     def _display_prepare(
         self,
-        pretty: bool = False,
-        new_line: str = "\n",
-        indent: str = "  ",
-        depth_level: int = 0,
+        buffer: list[str],
+        pretty: bool,
+        new_line: str,
+        indentation: _Indentation,
+        depth_level: int,
     ) -> str:
-        class_name = getattr(
-            self.__class__, "display_name", self.__class__.__name__.lower()
-        )
-        new_line = new_line if pretty else ""
-        indent = indent if pretty else ""
-        attribute_space = " " if self.attributes else ""
-
-        return (
-            f"{''.join([new_line if depth_level else '', depth_level*indent])}"
-            f"<{class_name}{attribute_space}"
-            f"{' '.join((attr._display_prepare() for key, attr in self.attributes.items()))}>"
-            f"{''.join((child._display_prepare(pretty, new_line, indent, depth_level+1) for child in self.child_nodes))}"
-            f"{''.join([new_line, depth_level*indent, f'</{class_name}>']) if not issubclass(type(self), SelfClosingElement) else ''}"
-        )
+        """Appends opening part of the element into buffer and returns its closing part,
+        which is displayed after all child nodes."""
+        if depth_level:
+            buffer.append(new_line)
+        buffer.append(indentation[depth_level])
+        attributes = self._attributes
+        if attributes:
+            buffer.append(self._open_tag)
+            for attr in attributes.values():
+                buffer.append(" ")
+                buffer.append(attr.display())
+            buffer.append(">")
+        else:
+            buffer.append(self._start_tag)
+        close_tag = self._close_tag
+        if close_tag is None:
+            return ""
+        return new_line + indentation[depth_level] + close_tag
+
+    def _push_child_nodes(
+        self, stack: list[tuple[HtmlElement | Text, int] | str | None], depth_level: int
+    ) -> None:
+        """Pushes child nodes to display stack in reversed order, so they are displayed in original order."""
+        child_depth_level = depth_level + 1
+        for child in reversed(self.child_nodes):
+            stack.append((child, child_depth_level))
 
     def display(
         self, pretty: bool = True, new_line: str = "\n", indent: str = "  "
@@ -176,7 +260,34 @@ class HtmlElement(ContextElement):
         Returns:
             str: String representation of the element structure.
         """
-        return self._display_prepare(pretty, new_line, indent, 0)
+        new_line = new_line if pretty else ""
+        indentation = _Indentation(indent if pretty else "")
+        # Tree is walked with explicit stack of nodes and closing parts instead of recursion,
+        # and all parts of the whole tree are appended into one shared buffer
+        buffer: list[str] = []
+        stack: list[tuple[HtmlElement | Text, int] | str | None] = [(self, 0)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                buffer.append(item)
+                continue
+            if item is None:
+                # Separator between child nodes of container
+                buffer.append(new_line)
+                continue
+            node, depth_level = item
+            if type(node) is Text:
+                # Same as `Text._display_prepare`, inlined since text nodes are the most common leaves
+                if pretty and depth_level:
+                    buffer.append(new_line)
+                    buffer.append(indentation[depth_level])
+                buffer.append(node.value)
+                continue
+            closing = node._display_prepare(buffer, pretty, new_line, indentation, depth_level)
+            if closing:
+                stack.append(closing)
+            node._push_child_nodes(stack, depth_level)
+        return "".join(buffer)
 
     def __str__(self) -> str:
         return self.display()
@@ -184,13 +295,12 @@ class HtmlElement(ContextElement):
     def __repr__(self) -> str:
         return (
             f"<:: {self.__class__.__name__} element: {f'{len(self.child_nodes)} child nodes' if self.child_nodes else 'no childs'}"
-            f"{f', {len(self.attributes)} attributes' if self.attributes else ''} ::>"
+            f"{f', {len(self._attributes)} attributes' if self._attributes else ''} ::>"
         )
 
     def __getitem__(self, key: str | int | slice):
         if isinstance(key, str):
-            # Convert kwargs attribute name into dict value (as original HTML)
-            attribute_key: str = key.lower().strip("-").replace("_", "-")
+            attribute_key: str = _normalize_item_key(key)
 
             val = self.attributes.get(attribute_key)
             if val is None:
@@ -209,7 +319,6 @@ class HtmlElement(ContextElement):
         if isinstance(key, str):
             if isinstance(value, (str, float, int, HtmlAttribute)):
                 self._parse_attributes({key: value})
-                self._validate_attributes()
             else:
                 raise TypeError(
                     "You can only add new value of tag's attribute as 'str', 'float' or 'int' through dictionary notation."
@@ -217,10 +326,11 @@ class HtmlElement(ContextElement):
         elif isinstance(key, int):
             if len(self) < key:
                 raise IndexError("Out of range while inserting into child list.")
-            if issubclass(type(value), HtmlAttribute):
+            if isinstance(value, HtmlAttribute):
                 raise TypeError("Cannot add attribute into tag's child elements.")
-            elif issubclass(type(value), (Text, int, float, str)):
-                value = Text(str(value)) if not isinstance(value, Text) else value
+            elif isinstance(value, _TEXT_TYPES):
+                if not isinstance(value, Text):
+                    value = Text._from_str(value if isinstance(value, str) else str(value))
             else:
                 value = Container(value)
             self.add(value, index=key)
@@ -237,8 +347,7 @@ class HtmlElement(ContextElement):
 
     def __delitem__(self, key: str | int | slice):
         if isinstance(key, str):
-            # Convert kwargs attribute name into dict value (as original HTML)
-            attribute_key: str = key.lower().strip("-").replace("_", "-")
+            attribute_key: str = _normalize_item_key(key)
 
             val = self.attributes.get(attribute_key)
             if val:
@@ -268,7 +377,7 @@ class HtmlElement(ContextElement):
         elif isinstance(other, (HtmlAttribute)):
             self.add(other)
             return self
-        elif isinstance(other, (Text, str, float, int)):
+        elif isinstance(other, _TEXT_TYPES):
             return Container(self, other)
         else:
             raise TypeError(f"canot merge '{type(self)}' of type '{type(other)}'")
@@ -279,7 +388,7 @@ class HtmlElement(ContextElement):
         elif isinstance(other, (HtmlAttribute)):
             self.add(other)
             return self
-        elif isinstance(other, (Text, str, float, int)):
+        elif isinstance(other, _TEXT_TYPES):
             return Container(other, self)
         else:
             raise TypeError(f"canot merge '{type(self)}' of type '{type(other)}'")
@@ -292,8 +401,10 @@ class HtmlElement(ContextElement):
         if other < 0:
             raise ValueError(f"can't multiply sequence by negative values: '{other}'")
         new_container = Container()
-        for _ in range(other):
-            new_container.add(self)
+        if other:
+            # Same element repeated, so it is added into child list at once
+            new_container._child_nodes = [self] * other
+            self._remove_from_context(self)
         return new_container
 
     def add(
@@ -336,26 +447,32 @@ class HtmlElement(ContextElement):
 
         self._remove_from_context(element)
 
+        # Tree is walked in document order with explicit stack instead of recursion
         if isinstance(element, HtmlElement):
-            # Check self
-            if (
-                isinstance(self, type(element))
-                and self._match_attributes(self, element)
-                and self._match_specified_children(self, element)
-            ):
-                results.append(self)
-
-            # Check child_nodes if HtmlElement class
-            for child in self.child_nodes:
-                if isinstance(child, (HtmlElement)):
-                    child._find(element, results)
+            element_class = type(element)
+            element_stack: list[HtmlElement] = [self]
+            while element_stack:
+                element_node = element_stack.pop()
+                if (
+                    isinstance(element_node, element_class)
+                    and self._match_attributes(element_node, element)
+                    and self._match_specified_children(element_node, element)
+                ):
+                    results.append(element_node)
+                # Only HtmlElement children are pushed, Text nodes cannot match an element
+                element_stack.extend(
+                    [child for child in reversed(element_node.child_nodes) if isinstance(child, HtmlElement)]
+                )
 
         elif isinstance(element, Text):
-            for child in self.child_nodes:
-                if isinstance(child, Text) and element.value in child.value:
-                    results.append(child)
-                elif isinstance(child, HtmlElement):
-                    child._find(element, results)
+            stack: list[HtmlElement | Text] = list(reversed(self.child_nodes))
+            while stack:
+                node = stack.pop()
+                if isinstance(node, Text):
+                    if element.value in node.value:
+                        results.append(node)
+                elif isinstance(node, HtmlElement):
+                    stack.extend(reversed(node.child_nodes))
 
         return results
 
@@ -369,10 +486,15 @@ class HtmlElement(ContextElement):
         ):
             return True
 
-        for key, val in second_element.attributes.items():
-            if key not in first_element.attributes:
+        # Read attribute dicts directly, so searching does not create them for every visited node
+        second_attributes = second_element._attributes
+        if not second_attributes:
+            return True
+        first_attributes = first_element._attributes or {}
+        for key, val in second_attributes.items():
+            if key not in first_attributes:
                 return False
-            if val.value not in first_element.attributes[key].value:
+            if val.value not in first_attributes[key].value:
                 return False
         return True
 
@@ -418,35 +540,56 @@ class HtmlElement(ContextElement):
 
     @property
     def attributes(self) -> dict[str, HtmlAttribute]:
-        return self._attributes
+        attributes = self._attributes
+        if attributes is None:
+            attributes = self._attributes = {}
+        return attributes
 
 
 class SelfClosingElement(HtmlElement):
     """Subclass of `HtmlElement` used for every HTML self closing tag element.
     """
-    def __init__(self, *attributes, **kwgs_attributes):
-        super().__init__(*attributes, **kwgs_attributes)
 
-        if self.child_nodes:
-            raise IllegalCompositionError(
-                f"Self closing element '{self.__class__.__name__}' cannot contain inner content."
-            )
+    __slots__ = ()
+
+    _is_self_closing: bool = True
+
+    def _parse_inner_content(self, inner_content, index: int | None = None) -> None:
+        for attr in inner_content:
+            if not isinstance(attr, HtmlAttribute):
+                raise IllegalCompositionError(
+                    f"Self closing element '{self.__class__.__name__}' cannot contain inner content."
+                )
+        super()._parse_inner_content(inner_content, index=index)
 
 
 class Text(ContextElement):
     """Class representing text nodes inside HTML structure.
     """
+
+    __slots__ = ("value",)
+
     def __init__(self, text: Text | int | str | float | None):
         super().__init__()
-        if isinstance(text, Text):
-            text = text.value
-        elif isinstance(text, (int, float, str)):
-            text = str(text)
+        if isinstance(text, str):
+            self.value: str = escape_html(text)
+        elif isinstance(text, Text):
+            # Value of the other Text node is already escaped
+            self.value = text.value
+        elif isinstance(text, (int, float)):
+            self.value = escape_html(str(text))
         elif text is None:
-            text = ""
+            self.value = ""
         else:
             raise TypeError(f"Unsupported type for Text node value: {type(text)}")
-        self.value: str = escape_html(text)
+
+    @classmethod
+    def _from_str(cls, text: str) -> Text:
+        """Creates Text node from `str` without type dispatch. Node is not added into context,
+        as it is used only for child nodes, which are inserted into their parent element directly."""
+        text_node = cls.__new__(cls)
+        text_node.value = escape_html(text)
+        return text_node
 
     def add(self, *new_child: Text | int | str | float) -> Text:
         """Method for appending text in text node
@@ -462,14 +605,18 @@ class Text(ContextElement):
             When adding disallowed Type. Only Text, str, int or float are allowed.
         """
         for child in new_child:
-            if not isinstance(child, (Text | int | str | float)):
+            if not isinstance(child, _TEXT_TYPES):
                 raise TypeError(
                     f"Into class {self.__class__.__name__} you can only add another text!"
                 )
 
-            self.value += (
+        # Appended parts are escaped and joined first, so the value is extended only once
+        self.value += "".join(
+            [
                 child.value if isinstance(child, Text) else escape_html(str(child))
-            )
+                for child in new_child
+            ]
+        )
         return self
 
     def __len__(self) -> int:
@@ -500,42 +647,59 @@ class Text(ContextElement):
 
     def _display_prepare(
         self,
-        pretty: bool = False,
-        new_line: str = "\n",
-        indent: str = "  ",
-        depth_level: int = 0,
+        buffer: list[str],
+        pretty: bool,
+        new_line: str,
+        indentation: _Indentation,
+        depth_level: int,
     ) -> str:
-        new_line = new_line if pretty else ""
-        indent = indent if pretty else ""
+        if pretty and depth_level:
+            buffer.append(new_line)
+            buffer.append(indentation[depth_level])
+        buffer.append(self.value)
+        return ""
+
+    def _push_child_nodes(
+        self, stack: list[tuple[HtmlElement | Text, int] | str | None], depth_level: int
+    ) -> None:
+        """Text node has no child nodes to display."""
 
-        return (
-            f"{new_line if depth_level else ''}{depth_level*indent if depth_level else ''}{self.value}"
-            if pretty
-            else self.value
-        )
+
+_TEXT_TYPES = (Text, str, int, float)
 
 
 class Container(HtmlElement):
     """Class for storing elements. Does not have open/closing tags. Displays only child elements."""
 
+    __slots__ = ()
+
     def __init__(self, *inner_content):
         super().__init__(*inner_content)
-        if self.attributes:
+        if self._attributes:
             raise IllegalCompositionError(
                 f"{self.__class__.__name__} cannot contain attributes."
             )
 
     def _display_prepare(
         self,
-        pretty: bool = False,
-        new_line: str = "\n",
-        indent: str = "  ",
-        depth_level: int = 0,
+        buffer: list[str],
+        pretty: bool,
+        new_line: str,
+        indentation: _Indentation,
+        depth_level: int,
     ) -> str:
-        new_line = new_line if pretty else ""
-        indent = indent if pretty else ""
+        buffer.append(indentation[depth_level])
+        return ""
 
-        return f"{depth_level*indent}{new_line.join((child._display_prepare(pretty, new_line, indent, depth_level) for child in self.child_nodes))}"
+    def _push_child_nodes(
+        self, stack: list[tuple[HtmlElement | Text, int] | str | None], depth_level: int
+    ) -> None:
+        """Child nodes are displayed on the same depth level as container, separated by new line."""
+        child_nodes = self.child_nodes
+        for child_index in range(len(child_nodes) - 1, -1, -1):
+            stack.append((child_nodes[child_index], depth_level))
+            if child_index:
+                stack.append(None)
 
     def add(
         self,
@@ -544,7 +708,7 @@ class Container(HtmlElement):
     ):
         """Main method for adding new attributes, child html elements or text nodes into existing objects"""
         self._parse_inner_content(new_child, index=index)
-        if self.attributes:
+        if self._attributes:
             raise IllegalCompositionError(
                 f"{self.__class__.__name__} cannot contain attributes."
             )
@@ -586,6 +750,8 @@ class Document(Container):
 
     """
 
+    __slots__ = ("_head", "_body")
+
     def __init__(
         self,
         title="Page title",
@@ -600,6 +766,12 @@ class Document(Container):
             Doctype(declaration=doctype), Html(self.head, self.body)
         )
 
+    def _push_child_nodes(
+        self, stack: list[tuple[HtmlElement | Text, int] | str | None], depth_level: int
+    ) -> None:
+        """Doctype and Html are kept in own container, which pushes them in its place."""
+        cast(Container, self._child_nodes)._push_child_nodes(stack, depth_level)
+
     @property
     def head(self):
         return self._head
@@ -616,7 +788,7 @@ class Document(Container):
         """Main method for adding new attributes, child html elements or text nodes into existing objects"""
         self.body._parse_inner_content(new_child, index=index)
 
-        if self.attributes:
+        if self._attributes:
             raise IllegalCompositionError(
                 f"{self.__class__.__name__} cannot contain attributes."
             )
@@ -632,6 +804,9 @@ class Doctype(SelfClosingElement):
     """Defines the document type.
 
     """
+
+    __slots__ = ("_declaration", "_declaration_tag")
+
     def __init__(
         self,
         *attributes,
@@ -639,7 +814,7 @@ class Doctype(SelfClosingElement):
         **kwgs_attributes,
     ):
         super().__init__(*attributes, **kwgs_attributes)
-        self._declaration: str = declaration.value
+        self.declaration = declaration
 
     @property
     def declaration(self) -> str:
@@ -647,112 +822,144 @@ class Doctype(SelfClosingElement):
 
     @declaration.setter
     def declaration(self, value: DoctypeDeclaration) -> None:
-        self._declaration = value.value
+        # Declaration is kept per instance, class level tag name is not used for doctype
+        self._declaration: str = value.value
+        self._declaration_tag: str = f"<{value.value}>"
 
     def _display_prepare(
         self,
-        pretty: bool = False,
-        new_line: str = "\n",
-        indent: str = "  ",
-        depth_level: int = 0,
+        buffer: list[str],
+        pretty: bool,
+        new_line: str,
+        indentation: _Indentation,
+        depth_level: int,
     ) -> str:
-        class_name = getattr(
-            self.__class__, "display_name", self.declaration
-        )
-        new_line = new_line if pretty else ""
-        indent = indent if pretty else ""
-
-        return (
-            f"{''.join([new_line if depth_level else '', depth_level*indent])}"
-            f"<{class_name}>"
-        )
+        if depth_level:
+            buffer.append(new_line)
+        buffer.append(indentation[depth_level])
+        buffer.append(self._declaration_tag)
+        return ""
 
 
 class Html(HtmlElement):
     """Defines an HTML document."""
 
+    __slots__ = ()
+
 
 class Head(HtmlElement):
     """Contains metadata/information for the document."""
 
+    __slots__ = ()
+
 
 class Title(HtmlElement):
     """Defines a title for the document."""
 
+    __slots__ = ()
+
 
 class Body(HtmlElement):
     """Defines the document's body."""
 
+    __slots__ = ()
+
 
 class H1(HtmlElement):
     """Defines HTML H1 heading."""
 
+    __slots__ = ()
+
 
 class H2(HtmlElement):
     """Defines HTML H2 heading."""
 
+    __slots__ = ()
+
 
 class H3(HtmlElement):
     """Defines HTML H3 heading."""
 
+    __slots__ = ()
+
 
 class H4(HtmlElement):
     """Defines HTML H4 heading."""
 
+    __slots__ = ()
+
 
 class H5(HtmlElement):
     """Defines HTML H5 heading."""
 
+    __slots__ = ()
+
 
 class H6(HtmlElement):
     """Defines HTML H6 heading."""
 
+    __slots__ = ()
+
 
 class Paragraph(HtmlElement):
     """Defines a paragraph. Alias to 'P' class."""
 
+    __slots__ = ()
+
     display_name: str = "p"
 
 
 class P(HtmlElement):
     """Defines a paragraph. Alias to 'Paragraph' class."""
 
+    __slots__ = ()
+
 
 class Br(SelfClosingElement):
     """Inserts a single line break."""
 
+    __slots__ = ()
+
 
 class Hr(SelfClosingElement):
     """Defines a thematic change in the content."""
 
+    __slots__ = ()
+
 
 class Comment(HtmlElement):
     """Class defining comment element."""
 
+    __slots__ = ("_condition",)
+
     def __init__(self, *inner_content, condition: str = "", **kwargs):
         super().__init__(*inner_content, **kwargs)
         self._condition = condition
 
     def _display_prepare(
         self,
-        pretty: bool = False,
-        new_line: str = "\n",
-        indent: str = "  ",
-        depth_level: int = 0,
+        buffer: list[str],
+        pretty: bool,
+        new_line: str,
+        indentation: _Indentation,
+        depth_level: int,
     ) -> str:
-        new_line = new_line if pretty and self.child_nodes else ""
-        indent = indent if pretty else ""
-        attribute_space = " " if self.attributes else ""
+        new_line = new_line if self.child_nodes else ""
 
         start_condition = f"<!--[if {self._condition}]>" if self._condition else "<!--"
         end_condition = "<![endif]-->" if self._condition else "-->"
-        return (
-            f"{''.join((new_line, depth_level*indent)) if depth_level else ''}"
-            f"{start_condition}{attribute_space}{' '.join((attr._display_prepare() for key, attr in self.attributes.items()))}"
-            f"{''.join((child._display_prepare(pretty, new_line, indent, depth_level+1) for child in self.child_nodes))}"
-            f"{new_line + (depth_level*indent) + end_condition}"
-            f"{new_line if depth_level and not self.child_nodes else ''}"
-        )
+        if depth_level:
+            buffer.append(new_line)
+            buffer.append(indentation[depth_level])
+        buffer.append(start_condition)
+        if self._attributes:
+            for attr in self._attributes.values():
+                buffer.append(" ")
+                buffer.append(attr.display())
+        closing = new_line + indentation[depth_level] + end_condition
+        if depth_level and not self.child_nodes:
+            closing += new_line
+        return closing
 
 
 ## Formatting
@@ -760,329 +967,485 @@ class Acronym(HtmlElement):
     """Not supported in HTML5. Use <abbr> instead.
     Defines an acronym."""
 
+    __slots__ = ()
+
 
 class Abbr(HtmlElement):
     """Defines an abbreviation or an acronym."""
 
+    __slots__ = ()
+
 
 class Address(HtmlElement):
     """Defines contact information for the author/owner of a document/article."""
 
+    __slots__ = ()
+
 
 class B(HtmlElement):
     """Defines bold text."""
 
+    __slots__ = ()
+
 
 class Bdi(HtmlElement):
     """Isolates a part of text that might be formatted in a different direction from other text outside it."""
 
+    __slots__ = ()
+
 
 class Bdo(HtmlElement):
     """Overrides the current text direction."""
 
+    __slots__ = ()
+
 
 class Big(HtmlElement):
     """Not supported in HTML5. Use CSS instead.
     Defines big text."""
 
+    __slots__ = ()
+
 
 class Blockquote(HtmlElement):
     """Defines a section that is quoted from another source"""
 
+    __slots__ = ()
+
 
 class Center(HtmlElement):
     """Not supported in HTML5. Use CSS instead.
     Defines centered text."""
 
+    __slots__ = ()
+
 
 class Cite(HtmlElement):
     """Defines the title of a work."""
 
+    __slots__ = ()
+
 
 class Code(HtmlElement):
     """Defines a piece of computer code."""
 
+    __slots__ = ()
+
 
 class Del(HtmlElement):
     """Defines text that has been deleted from a document."""
 
+    __slots__ = ()
+
 
 class Dfn(HtmlElement):
     """Specifies a term that is going to be defined within the content."""
 
+    __slots__ = ()
+
 
 class Em(HtmlElement):
     """Defines emphasized text."""
 
+    __slots__ = ()
+
 
 class Font(HtmlElement):
     """Not supported in HTML5. Use CSS instead.
     Defines font, color, and size for text."""
 
+    __slots__ = ()
+
 
 class I(HtmlElement):  # noqa: E742
     """Defines a part of text in an alternate voice or mood."""
 
+    __slots__ = ()
+
 
 class Ins(HtmlElement):
     """Defines a text that has been inserted into a document."""
 
+    __slots__ = ()
+
 
 class Kbd(HtmlElement):
     """Defines keyboard input."""
 
+    __slots__ = ()
+
 
 class Mark(HtmlElement):
     """Defines marked/highlighted text."""
 
+    __slots__ = ()
+
 
 class Meter(HtmlElement):
     """Defines a scalar measurement within a known range (a gauge)."""
 
+    __slots__ = ()
+
 
 class Pre(HtmlElement):
     """Defines preformatted text."""
 
+    __slots__ = ()
+
 
 class Progress(HtmlElement):
     """Represents the progress of a task."""
 
+    __slots__ = ()
+
 
 class Q(HtmlElement):
     """Defines a short quotation."""
 
+    __slots__ = ()
+
 
 class Rp(HtmlElement):
     """Defines what to show in browsers that do not support ruby annotations."""
 
+    __slots__ = ()
+
 
 class Rt(HtmlElement):
     """Defines an explanation/pronunciation of characters (for East Asian typography)."""
 
+    __slots__ = ()
+
 
 class Ruby(HtmlElement):
     """Defines a ruby annotation (for East Asian typography)."""
 
+    __slots__ = ()
+
 
 class S(HtmlElement):
     """Defines text that is no longer correct."""
 
+    __slots__ = ()
+
 
 class Samp(HtmlElement):
     """Defines sample output from a computer program."""
 
+    __slots__ = ()
+
 
 class Small(HtmlElement):
     """Defines smaller text."""
 
+    __slots__ = ()
+
 
 class Strike(HtmlElement):
     """Not supported in HTML5. Use <del> or <s> instead.
     Defines strikethrough text."""
 
+    __slots__ = ()
+
 
 class Strong(HtmlElement):
     """Defines important text."""
 
+    __slots__ = ()
+
 
 class Sub(HtmlElement):
     """Defines subscripted text."""
 
+    __slots__ = ()
+
 
 class Sup(HtmlElement):
     """Defines superscripted text."""
 
+    __slots__ = ()
+
 
 class Template(HtmlElement):
     """Defines a container for content that should be hidden when the page loads."""
 
+    __slots__ = ()
+
 
 class Time(HtmlElement):
     """Defines a specific time (or datetime)."""
 
+    __slots__ = ()
+
 
 class Tt(HtmlElement):
     """Not supported in HTML5. Use CSS instead.
     Defines teletype text."""
 
+    __slots__ = ()
+
 
 class U(HtmlElement):
     """Defines some text that is unarticulated and styled differently from normal text."""
 
+    __slots__ = ()
+
 
 class Var(HtmlElement):
     """Defines a variable."""
 
+    __slots__ = ()
+
 
 class Wbr(SelfClosingElement):
     """Defines a possible line-break."""
 
+    __slots__ = ()
+
 
 ## Forms and Input
 class Form(HtmlElement):
     """Defines an HTML form for user input."""
 
+    __slots__ = ()
+
 
 class Input(SelfClosingElement):
     """Defines an input control."""
 
+    __slots__ = ()
+
 
 class Textarea(HtmlElement):
     """Defines a multiline input control (text area)."""
 
+    __slots__ = ()
+
 
 class Button(HtmlElement):
     """Defines a clickable button."""
 
+    __slots__ = ()
+
 
 class Select(HtmlElement):
     """Defines a drop-down list."""
 
+    __slots__ = ()
+
 
 class Optgroup(HtmlElement):
     """Defines a group of related options in a drop-down list."""
 
+    __slots__ = ()
+
 
 class Option(HtmlElement):
     """Defines an option in a drop-down list."""
 
+    __slots__ = ()
+
 
 class Label(HtmlElement):
     """Defines a label for an <input> element."""
 
+    __slots__ = ()
+
 
 class Fieldset(HtmlElement):
     """Groups related elements in a form."""
 
+    __slots__ = ()
+
 
 class Legend(HtmlElement):
     """Defines a caption for a <fieldset> element."""
 
+    __slots__ = ()
+
 
 class Datalist(HtmlElement):
     """Specifies a list of pre-defined options for input controls."""
 
+    __slots__ = ()
+
 
 class Output(HtmlElement):
     """Defines the result of a calculation."""
 
+    __slots__ = ()
+
 
 ## Frames
 class Frame(HtmlElement):
     """Not supported in HTML5.
     Defines a window (a frame) in a frameset."""
 
+    __slots__ = ()
+
 
 class Frameset(HtmlElement):
     """Not supported in HTML5.
     Defines a set of frames."""
 
+    __slots__ = ()
+
 
 class Noframes(HtmlElement):
     """Not supported in HTML5.
     Defines an alternate content for users that do not support frames."""
 
+    __slots__ = ()
+
 
 class Iframe(HtmlElement):
     """Defines an inline frame."""
 
+    __slots__ = ()
+
 
 ## Images
 class Img(SelfClosingElement):
     """Defines an image."""
 
+    __slots__ = ()
+
 
 class Map(HtmlElement):
     """Defines a client-side image map."""
 
+    __slots__ = ()
+
 
 class Area(SelfClosingElement):
     """Defines an area inside an image map."""
 
+    __slots__ = ()
+
 
 class Canvas(HtmlElement):
     """Used to draw graphics, on the fly, via scripting (usually JavaScript)."""
 
+    __slots__ = ()
+
 
 class Figcaption(HtmlElement):
     """Defines a caption for a <figure> element."""
 
+    __slots__ = ()
+
 
 class Figure(HtmlElement):
     """Specifies self-contained content."""
 
+    __slots__ = ()
+
 
 class Picture(HtmlElement):
     """Defines a container for multiple image resources."""
 
+    __slots__ = ()
+
 
 class Svg(HtmlElement):
     """Defines a container for SVG graphics."""
 
+    __slots__ = ()
+
 
 ## Audio / Video
 class Audio(HtmlElement):
     """Defines sound content."""
 
+    __slots__ = ()
+
 
 class Source(SelfClosingElement):
     """Defines multiple media resources for media elements (<video>, <audio> and <picture>)."""
 
+    __slots__ = ()
+
 
 class Track(SelfClosingElement):
     """Defines text tracks for media elements (<video> and <audio>)."""
 
+    __slots__ = ()
+
 
 class Video(HtmlElement):
     """Defines a video or movie."""
 
+    __slots__ = ()
+
 
 ## Links
 class A(HtmlElement):
     """Defines a hyperlink."""
 
+    __slots__ = ()
+
 
 class Link(SelfClosingElement):
     """Defines the relationship between a document and an external resource (most used to link to style sheets)."""
 
+    __slots__ = ()
+
 
 class Nav(HtmlElement):
     """Defines navigation links."""
 
+    __slots__ = ()
+
 
 ## Lists
 class Menu(HtmlElement):
     """Defines an alternative unordered list."""
 
+    __slots__ = ()
+
 
 class Ul(HtmlElement):
     """Defines an unordered list."""
 
+    __slots__ = ()
+
 
 class Ol(HtmlElement):
     """Defines an ordered list."""
 
+    __slots__ = ()
+
 
 class Li(HtmlElement):
     """Defines a list item."""
 
+    __slots__ = ()
+
 
 class Dir(HtmlElement):
     """Not supported in HTML5. Use <ul> instead.
     Defines a directory list."""
 
+    __slots__ = ()
+
 
 class Dl(HtmlElement):
     """Defines a description list."""
 
+    __slots__ = ()
+
 
 class Dt(HtmlElement):
     """Defines a term/name in a description list"""
 
+    __slots__ = ()
+
 
 class Dd(HtmlElement):
     """Defines a description of a term/name in a description list"""
 
+    __slots__ = ()
+
 
 ## Tables
 class TableOption(Enum):
@@ -1098,42 +1461,62 @@ class HeaderOption(Enum):
 class Caption(HtmlElement):
     """Defines a table caption."""
 
+    __slots__ = ()
+
 
 class Td(HtmlElement):
     """Defines a cell in a table."""
 
+    __slots__ = ()
+
 
 class Tr(HtmlElement):
     """Defines a row in a table."""
 
+    __slots__ = ()
+
 
 class Th(HtmlElement):
     """Defines a header cell in a table."""
 
+    __slots__ = ()
+
 
 class Tfoot(HtmlElement):
     """Groups the footer content in a table."""
 
+    __slots__ = ()
+
 
 class Tbody(HtmlElement):
     """Groups the body content in a table."""
 
+    __slots__ = ()
+
 
 class Thead(HtmlElement):
     """Groups the header content in a table."""
 
+    __slots__ = ()
+
 
 class Col(SelfClosingElement):
     """Specifies column properties for each column within a <colgroup> element."""
 
+    __slots__ = ()
+
 
 class Colgroup(HtmlElement):
     """Specifies a group of one or more columns in a table for formatting."""
 
+    __slots__ = ()
+
 
 class Table(HtmlElement):
     """Class defining table element."""
 
+    __slots__ = ()
+
     def _create_table(
         self, header: None | str | list[HtmlElement | Text | str | int | float]
     ) -> None:
@@ -1151,51 +1534,58 @@ class Table(HtmlElement):
         IllegalCompositionError
             Table was wrongly builded.
         """
-        container_nodes: list[Container] = [
-            child for child in self.child_nodes if isinstance(child, Container)
-        ]
-        if not container_nodes:
+        # Only the first Container is converted, so the search stops there
+        container_index, container = next(
+            (
+                (child_index, child)
+                for child_index, child in enumerate(self.child_nodes)
+                if isinstance(child, Container)
+            ),
+            (None, None),
+        )
+        if container_index is None or container is None:
             return
-        container: Container = container_nodes[0]
         rows: list[Container] = [
             child for child in container.child_nodes if isinstance(child, Container)
         ]
         col_count: int | None = len(rows[0]) if rows else None
-        checked_cols: bool = all(len(row) == col_count for row in rows)
-
-        if not checked_cols:
+        # All rows have to be of the same length
+        if len(set(map(len, rows))) > 1:
             return
 
-        table: HtmlElement = Container()
+        # Rows are collected in plain list and every row is created with all its cells at once
+        table_rows: list[Tr] = []
         if isinstance(header, (list, tuple)):
             if len(header) != col_count:
                 raise IllegalCompositionError(
                     f"Table header length ({len(header)}) don't match table row length ({col_count})."
                 )
-            header_row = Tr(*[Th(head_cell) for head_cell in header])
-            table.add(header_row)
+            table_rows.append(Tr(*[Th(head_cell) for head_cell in header]))
+
+        # Cell classes are chosen once per column for the first row and for the other rows
+        col_count = col_count or 0
+        header_col_cells: list[type[HtmlElement]] = [Th] + [Td] * (col_count - 1)
+        body_cells: list[type[HtmlElement]] = [Td] * col_count
+        first_row_cells = body_cells
+        if header == "row":
+            first_row_cells = [Th] * col_count
+        elif header == "col":
+            first_row_cells = body_cells = header_col_cells
+        elif header == "both":
+            first_row_cells = header_col_cells
+
         for row_num, row in enumerate(rows):
-            tab_row = Tr()
-            table.add(tab_row)
-            for col_num, col in enumerate(row):
-                if header == "row" and row_num == 0:
-                    tab_row.add(Th(col))
-                elif header == "col" and col_num == 0:
-                    tab_row.add(Th(col))
-                elif header == "both" and row_num == 0 and col_num == 0:
-                    tab_row.add(Th(col))
-                else:
-                    tab_row.add(Td(col))
+            cells = first_row_cells if row_num == 0 else body_cells
+            table_rows.append(Tr(*[cell(col) for cell, col in zip(cells, row)]))
 
-        idx = self.child_nodes.index(container)
-        del self.child_nodes[idx]
-        self.add(*table)
+        del self.child_nodes[container_index]
+        self.add(*table_rows)
 
     def __init__(
         self,
         *attributes,
         header: None | str | list[HtmlElement | Text | str | int | float] = None,
-        options: dict[TableOption, HeaderOption] = {},
+        options: dict[TableOption, HeaderOption] | None = None,
         **kwargs,
     ):
         super().__init__(*attributes, **kwargs)
@@ -1206,98 +1596,146 @@ class Table(HtmlElement):
 class Style(HtmlElement):
     """Defines style information for a document."""
 
+    __slots__ = ()
+
 
 class Div(HtmlElement):
     """Defines a section in a document."""
 
+    __slots__ = ()
+
 
 class Span(HtmlElement):
     """Defines a section in a document."""
 
+    __slots__ = ()
+
 
 class Header(HtmlElement):
     """Defines a header for a document or section."""
 
+    __slots__ = ()
+
 
 class Hgroup(HtmlElement):
     """Defines a header and related content."""
 
+    __slots__ = ()
+
 
 class Footer(HtmlElement):
     """Class defining footer document element."""
 
+    __slots__ = ()
+
 
 class Main(HtmlElement):
     """Specifies the main content of a document."""
 
+    __slots__ = ()
+
 
 class Section(HtmlElement):
     """Defines a section in a document."""
 
+    __slots__ = ()
+
 
 class Search(HtmlElement):
     """Defines a search section."""
 
+    __slots__ = ()
+
 
 class Article(HtmlElement):
     """Defines an article."""
 
+    __slots__ = ()
+
 
 class Aside(HtmlElement):
     """Defines content aside from the page content."""
 
+    __slots__ = ()
+
 
 class Details(HtmlElement):
     """Defines additional details that the user can view or hide."""
 
+    __slots__ = ()
+
 
 class Dialog(HtmlElement):
     """Defines a dialog box or window."""
 
+    __slots__ = ()
+
 
 class Summary(HtmlElement):
     """Defines a visible heading for a <details> element."""
 
+    __slots__ = ()
+
 
 class Data(HtmlElement):
     """Adds a machine-readable translation of a given content."""
 
+    __slots__ = ()
+
 
 ## Meta Info
 class Meta(SelfClosingElement):
     """Defines metadata about an HTML document."""
 
+    __slots__ = ()
+
 
 class Base(SelfClosingElement):
     """Specifies the base URL/target for all relative URLs in a document."""
 
+    __slots__ = ()
+
 
 class Basefont(HtmlElement):
     """Not supported in HTML5. Use CSS instead.
     Specifies a default color, size, and font for all text in a document."""
 
+    __slots__ = ()
+
 
 ## Programming
 class Script(HtmlElement):
     """Defines a client-side script."""
 
+    __slots__ = ()
+
 
 class Noscript(HtmlElement):
     """Defines an alternate content for users that do not support client-side scripts."""
 
+    __slots__ = ()
+
 
 class Applet(HtmlElement):
     """Not supported in HTML5. Use <embed> or <object> instead.
     Defines an embedded applet."""
 
+    __slots__ = ()
+
 
 class Embed(SelfClosingElement):
     """Defines a container for an external (non-HTML) application."""
 
+    __slots__ = ()
+
 
 class Object(HtmlElement):
     """Defines an embedded object."""
 
+    __slots__ = ()
+
 
 class Param(HtmlElement):
     """Defines a parameter for an object."""
+
+    __slots__ = ()
@@ -3,28 +3,49 @@ import importlib
 from typing import Type, Any
 
 
+_UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+
+
 def prepend_dash_before_uppercase(input_str: str) -> str:
-    return re.sub(r"([A-Z])", r"-\1", input_str)
+    return _UPPERCASE_PATTERN.sub(r"-\g<0>", input_str)
+
+
+_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        ">": "&gt;",
+        "<": "&lt;",
+        "'": "&#39;",
+        '"': "&#34;",
+    }
+)
 
 
 def escape_html(text: str) -> str:
-    return (
-        text.replace("&", "&amp;")
-        .replace(">", "&gt;")
-        .replace("<", "&lt;")
-        .replace("'", "&#39;")
-        .replace('"', "&#34;")
-    )
+    # Most values have nothing to escape, so they are returned without copying.
+    # Substring checks use memchr in C, which is much faster than regex search on long text.
+    if not (
+        "&" in text or "<" in text or ">" in text or '"' in text or "'" in text
+    ):
+        return text
+    return text.translate(_ESCAPE_TABLE)
+
+
+_UNESCAPE_ENTITIES = {
+    "&#34;": '"',
+    "&#39;": "'",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&amp;": "&",
+}
+_UNESCAPE_PATTERN = re.compile("|".join(map(re.escape, _UNESCAPE_ENTITIES)))
 
 
 def unescape_html(text: str) -> str:
-    return (
-        text.replace("&#34;", '"')
-        .replace("&#39;", "'")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&amp;", "&")
-    )
+    # Every entity starts with `&`, text without it is returned without copying
+    if "&" not in text:
+        return text
+    return _UNESCAPE_PATTERN.sub(lambda match: _UNESCAPE_ENTITIES[match.group()], text)
 
 
 def get_class_from_string(module_name: str, class_name: str) -> Type[Any]:
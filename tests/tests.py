@@ -1,4 +1,5 @@
 import pytest
+from copy import deepcopy
 from generateHtml.tags import *
 from generateHtml.attributes import *
 from generateHtml.exceptions import *
@@ -12,6 +13,9 @@ def test_initialize_tags():
 
     with pytest.raises(IllegalCompositionError):
         Hr(P("text"))
+    with pytest.raises(IllegalCompositionError):
+        Hr().add("text")
+    assert {} == P().attributes
 
 
 def test_display_function():
@@ -21,12 +25,31 @@ def test_display_function():
     )
 
 
+def test_display_deeply_nested():
+    root = Div()
+    node = root
+    for _ in range(5000):
+        child = Div()
+        node.add(child)
+        node = child
+    assert "<div>" * 5001 + "</div>" * 5001 == root.display(pretty=False)
+    assert 5001 == len(root.find(Div()))
+
+
 def test_initialize_text():
     assert "Text" == str(Text("Text"))
     assert "1" == str(Text(1))
     assert "1.0" == str(Text(1.0))
     assert "" == str(Text(""))
     assert "" == str(Text(None))
+    assert "&lt;b&gt;" == str(Text(Text("<b>")))
+
+def test_node_slots():
+    assert not hasattr(Text("Text"), "__dict__")
+    assert not hasattr(Container(P()), "__dict__")
+    assert not hasattr(Div(), "__dict__")
+    assert not hasattr(Img(), "__dict__")
+    assert not hasattr(Table(), "__dict__")
 
 def test_name_to_string():
     assert "id" == Id("id1").name_to_string()
@@ -63,6 +86,18 @@ def test_attribute_value():
 def test_attribute_name():
     attr = Id('id1')
     assert "id" == attr.name
+    assert "accept-charset" == AcceptCharset("utf-8").name
+    assert "data-id" == Data_("id", "value").name
+
+def test_attribute_slots():
+    import generateHtml.attributes as attributes_module
+
+    for obj in vars(attributes_module).values():
+        if isinstance(obj, type) and issubclass(obj, HtmlAttribute):
+            assert "__slots__" in obj.__dict__, f"{obj.__name__} is missing __slots__"
+    assert not hasattr(Id("id1"), "__dict__")
+    assert not hasattr(Required(), "__dict__")
+    assert not hasattr(Data_("id", "value"), "__dict__")
 
 def test_initialize_attributes():
     assert 'id="new_id"' == str(Id("new_id"))
@@ -85,6 +120,14 @@ def test_initialize_boolean_attributes():
     with pytest.raises(ValueError):
         str(Required(true_value=1))
 
+    # Unsupported display option is rejected when it is set, not when it is displayed
+    with pytest.raises(ValueError):
+        Required(true_value=1)
+    required = Required()
+    with pytest.raises(ValueError):
+        required.true_value_display = 1
+    assert 'required' == str(required)
+
 def test_initialize_styles():
     assert 'style="color: black;font-size: 20 px;"' == str(
         Style_(color="black", font_size="20 px")
@@ -178,6 +221,13 @@ def test_tag_operators_manipulation():
     assert "<em>\n  emphasized\n</em>\n<hr>" == str(em)
 
 
+def test_add_self():
+    p: HtmlElement = P("Text", Id("p_id"))
+    with pytest.raises(IllegalCompositionError):
+        p.add(p)
+    assert '<p id="p_id">Text</p>' == p.display(pretty=False)
+
+
 def test_table_initialization():
     t1 = Table(
         Tr(Th('Col 1'), Th('Col 2'), Th('Col 3')),
@@ -206,6 +256,10 @@ def test_table_initialization():
     assert "<table><tr><th>Col 1</th><td>Col 2</td></tr><tr><th>1</th><td>2</td></tr><tr><th>3</th><td>4</td></tr></table>"\
         == t4.display(pretty=False)
 
+    with Div() as div:
+        Table([[1, 2]], header='row')
+    assert "<div><table><tr><th>1</th><th>2</th></tr></table></div>" == div.display(pretty=False)
+
 def test_find():
     inner_div = Div(Id("inner_div"))
     li_list = [Li(i) for i in range(10)]
@@ -284,3 +338,34 @@ def test_context_manager():
         '<p class="paragraph_class">\n  Text\n  <span id="span_id">\n    span\n  </span>\n</p>'
         == str(p)
     )
+
+    div = Div()
+    with div:
+        P("1")
+        with div:
+            P("2")
+        P("3")
+
+    assert "<div><p>2</p><p>1</p><p>3</p></div>" == div.display(pretty=False)
+
+
+def test_copy_in_context():
+    p = P("Text", Id("p_id"))
+    with p:
+        copied = deepcopy(p)
+        Span("1")
+    assert '<p id="p_id">Text<span>1</span></p>' == p.display(pretty=False)
+    assert '<p id="p_id">Text</p>' == copied.display(pretty=False)
+
+    with copied:
+        Span("2")
+    assert '<p id="p_id">Text<span>2</span></p>' == copied.display(pretty=False)
+
+    div = Div()
+    span = Span()
+    div.add(span)
+    with span:
+        copied = deepcopy(div)
+        with pytest.raises(IllegalCompositionError):
+            div.add(div)
+    assert "<div><span></span></div>" == copied.display(pretty=False)